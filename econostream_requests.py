@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 """
 Scraper Econostream (liste + article complet) sans Selenium.
-Compatible Render Free (requests + BeautifulSoup uniquement).
+Compatible Render Free (httpx + selectolax/BeautifulSoup uniquement).
 
 Exposé par main.py via FastAPI :
 - /scrape        -> liste d'URLs
@@ -9,23 +9,46 @@ Exposé par main.py via FastAPI :
 """
 from __future__ import annotations
 
+import asyncio
+import functools
+import os
 import re
 import time
-from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from html import unescape as _unescape
+from threading import Lock
+
+from cachetools import LRUCache, TTLCache
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields as _dc_fields
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
 from urllib.parse import urljoin, urlsplit, urlunsplit, quote
 
-import requests
-from bs4 import BeautifulSoup
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import httpx
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
 from dateutil import parser as dateparser
 
+# Moteur C Modest (selectolax) pour les chemins chauds ; BeautifulSoup
+# reste le repli si la wheel n'est pas disponible sur la cible.
+try:
+    from selectolax.parser import HTMLParser as _SxHTMLParser
+except ImportError:  # pragma: no cover
+    _SxHTMLParser = None
+
+# Parseur ISO 8601 en C, encore plus rapide que fromisoformat.
+try:
+    import ciso8601
+except ImportError:  # pragma: no cover
+    ciso8601 = None
+
 from typing import Dict, List, Optional, Tuple
 
 BASE_URL = "https://www.econostream-media.com"
 START_URL = f"{BASE_URL}/news"
 
 # --------------------------- utils généraux --------------------------- #
+@functools.lru_cache(maxsize=4096)
 def _encode_url(url: str) -> str:
     """Encode path & query (RFC 3986) pour gérer les ’ etc."""
     parts = urlsplit(url)
@@ -34,6 +57,7 @@ def _encode_url(url: str) -> str:
     return urlunsplit((parts.scheme, parts.netloc, encoded_path, encoded_query, parts.fragment))
 
 
+@functools.lru_cache(maxsize=4096)
 def _abs_and_encode(href: Optional[str], base: str = BASE_URL) -> Optional[str]:
     """href -> URL absolue encodée, ou None si invalide."""
     if not href:
@@ -42,56 +66,285 @@ def _abs_and_encode(href: Optional[str], base: str = BASE_URL) -> Optional[str]:
     return _encode_url(absolute)
 
 
+# Sous-arbres utiles seulement : on garde "div" pour que les sélecteurs à base
+# de classes (.site-list, .article, div[itemprop]) restent valides, mais on
+# évite de matérialiser scripts, styles, header, etc.
+_LIST_STRAINER = SoupStrainer(["div", "nav", "h3", "a"])
+_ARTICLE_STRAINER = SoupStrainer(
+    ["article", "div", "meta", "figure", "figcaption", "title", "h1", "h2", "h3", "p"]
+)
+
+
+def _soup(html: Union[str, bytes], parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """BeautifulSoup sur le parseur C lxml (bien plus rapide que html.parser)."""
+    return BeautifulSoup(html, "lxml", parse_only=parse_only)
+
+
+# Regex compilées une fois : _clean tourne sur chaque paragraphe de chaque
+# article, le fallback date une fois par article sans méta.
+_RE_SPACES = re.compile(r"[ \t]+")
+_RE_NL = re.compile(r"\s+\n")
+_RE_DATE_FALLBACK = re.compile(r"\b(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})\b")
+
+# NBSP et tab -> espace en un seul passage C sur la table de code points.
+_CLEAN_TRANS = str.maketrans({"\xa0": " ", "\t": " "})
+
+
 def _clean(s: str) -> str:
     """Nettoyage léger d'espaces et NBSP."""
     if s is None:
         return ""
-    s = s.replace("\xa0", " ")
-    s = re.sub(r"[ \t]+", " ", s)
-    s = re.sub(r"\s+\n", "\n", s)
+    s = s.translate(_CLEAN_TRANS)
+    # Après translate il ne reste que des espaces simples à fusionner ;
+    # les prechecks évitent la regex pour le texte déjà propre (cas courant).
+    if "  " in s:
+        s = _RE_SPACES.sub(" ", s)
+    if "\n" in s:
+        s = _RE_NL.sub("\n", s)
     return s.strip()
 
 
-def _make_session(timeout: int = 15) -> requests.Session:
-    """Session requests avec retries/backoff + UA propre."""
-    s = requests.Session()
-    s.headers.update({
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/123.0.0.0 Safari/537.36"
-        ),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.8",
-        "Cache-Control": "no-cache",
-        "Pragma": "no-cache",
-        "Connection": "keep-alive",
-    })
-    retries = Retry(
-        total=3,
-        backoff_factor=0.6,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["GET", "HEAD"],
-        respect_retry_after_header=True,
+_DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/123.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Accept-Language": "en-US,en;q=0.8",
+    "Cache-Control": "no-cache",
+    "Pragma": "no-cache",
+}
+
+# Nombre max de téléchargements d'articles simultanés.
+_FETCH_CONCURRENCY = 8
+
+# Cache url -> Article : un article publié ne change quasiment jamais,
+# inutile de re-télécharger/re-parser pendant 1h. Lock car le cache est
+# partagé entre la boucle asyncio et les endpoints sync.
+_ARTICLE_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=3600)
+_ARTICLE_CACHE_LOCK = Lock()
+
+
+def _cache_get(url: str):
+    with _ARTICLE_CACHE_LOCK:
+        return _ARTICLE_CACHE.get(url)
+
+
+def _cache_put(url: str, article) -> None:
+    with _ARTICLE_CACHE_LOCK:
+        _ARTICLE_CACHE[url] = article
+
+
+# Retry sur statut : le transport httpx (retries=3) ne rejoue que les
+# erreurs de connexion, on réimplémente donc l'équivalent de l'ancien
+# urllib3.Retry(total=3, backoff_factor=0.6, status_forcelist=[...],
+# respect_retry_after_header=True) au-dessus des GET.
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.6
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+    """Délai avant rejeu (attempt 0-based) ; honore Retry-After en secondes."""
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass  # format HTTP-date : on retombe sur le backoff
+    return _RETRY_BACKOFF * (2 ** attempt)
+
+
+def _get_with_retries(client: httpx.Client, url: str, headers=None) -> httpx.Response:
+    for attempt in range(_RETRY_TOTAL + 1):
+        r = client.get(url, headers=headers)
+        if r.status_code not in _RETRY_STATUSES or attempt == _RETRY_TOTAL:
+            return r
+        time.sleep(_retry_delay(attempt, r.headers.get("Retry-After")))
+    return r  # pragma: no cover
+
+
+async def _aget_with_retries(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    for attempt in range(_RETRY_TOTAL + 1):
+        r = await client.get(url)
+        if r.status_code not in _RETRY_STATUSES or attempt == _RETRY_TOTAL:
+            return r
+        await asyncio.sleep(_retry_delay(attempt, r.headers.get("Retry-After")))
+    return r  # pragma: no cover
+
+
+def _make_client(timeout: int = 15) -> httpx.Client:
+    """Client httpx HTTP/2 (keep-alive, retries connexion) + UA propre."""
+    return httpx.Client(
+        http2=True,
+        headers=_DEFAULT_HEADERS,
+        timeout=timeout,
+        limits=httpx.Limits(max_keepalive_connections=20),
+        transport=httpx.HTTPTransport(retries=3),
+        follow_redirects=True,
     )
-    s.mount("http://", HTTPAdapter(max_retries=retries))
-    s.mount("https://", HTTPAdapter(max_retries=retries))
-    s.request_timeout = timeout  # attribut informel pour porter le timeout
-    return s
 
 
-def _fetch_html(session: requests.Session, url: str) -> str:
-    r = session.get(url, timeout=getattr(session, "request_timeout", 15))
+# GET conditionnel pour les pages liste (re-sondées à chaque /scrape) :
+# url -> (etag, last_modified, html). Un 304 évite le corps et tout le parse.
+# Borné en LRU : chaque entrée porte la page entière, un dict nu fuirait
+# au fil d'un crawl all_pages sur l'instance Render.
+_COND_CACHE: LRUCache = LRUCache(maxsize=64)
+_COND_CACHE_LOCK = Lock()
+
+
+def _fetch_html(client: httpx.Client, url: str) -> bytes:
+    with _COND_CACHE_LOCK:
+        entry = _COND_CACHE.get(url)
+
+    headers = {}
+    if entry:
+        etag, last_modified, _ = entry
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    r = _get_with_retries(client, url, headers=headers or None)
+    if r.status_code == 304 and entry:
+        return entry[2]
     r.raise_for_status()
-    return r.text
+
+    # Bytes bruts : lxml et selectolax parsent l'UTF-8 natif plus vite
+    # qu'une str pré-décodée, et on évite une copie par page.
+    html = r.content
+    etag = r.headers.get("ETag")
+    last_modified = r.headers.get("Last-Modified")
+    if etag or last_modified:
+        with _COND_CACHE_LOCK:
+            _COND_CACHE[url] = (etag, last_modified, html)
+    return html
+
+
+def _make_async_client(timeout: int = 15) -> httpx.AsyncClient:
+    """Pendant async de _make_client (mêmes réglages HTTP/2)."""
+    return httpx.AsyncClient(
+        http2=True,
+        headers=_DEFAULT_HEADERS,
+        timeout=timeout,
+        limits=httpx.Limits(max_keepalive_connections=20),
+        transport=httpx.AsyncHTTPTransport(retries=3),
+        follow_redirects=True,
+    )
+
+
+async def _afetch(client: httpx.AsyncClient, url: str, sem: asyncio.Semaphore) -> bytes:
+    async with sem:
+        r = await _aget_with_retries(client, url)
+        r.raise_for_status()
+        return r.content
+
+
+async def _afetch_pair(client: httpx.AsyncClient, url: str, sem: asyncio.Semaphore) -> Tuple[str, bytes]:
+    return url, await _afetch(client, url, sem)
+
+
+async def _fetch_many(urls: List[str], timeout: int = 15) -> List[Tuple[str, bytes]]:
+    """Télécharge les articles en concurrence, multiplexés en HTTP/2."""
+    if not urls:
+        return []
+    sem = asyncio.Semaphore(_FETCH_CONCURRENCY)
+    async with _make_async_client(timeout) as client:
+        htmls = await asyncio.gather(*(_afetch(client, u, sem) for u in urls))
+    return list(zip(urls, htmls))
 
 
 # --------------------------- parsing de la liste --------------------------- #
-def _parse_article_links_from_html(html: str) -> Tuple[List[str], Optional[str]]:
+# Extraction des liens par regex sur les octets bruts : pas de DOM du tout
+# pour la page liste. Le repli DOM reste si le balisage ne matche pas.
+# Le motif accepte les hrefs relatifs et absolus vers le site.
+_NEWS_PREFIX = f"{BASE_URL}/news/"
+_RE_NEWS_HREF = re.compile(
+    rb'href="((?:' + re.escape(BASE_URL).encode("ascii") + rb')?/news/[^"]+\.html)"'
+)
+_RE_NAV_BLOCK = re.compile(rb"<nav\b.*?</nav>", re.I | re.S)
+_RE_NAV_ANCHOR = re.compile(rb'<a\b[^>]*href="([^"]+)"[^>]*>(.*?)</a>', re.I | re.S)
+_RE_TAGS = re.compile(rb"<[^>]+>")
+
+
+def _parse_article_links_dom(html: Union[str, bytes]) -> Tuple[List[str], Optional[str]]:
+    """Repli DOM du chemin regex (selectolax si dispo, sinon BS4)."""
+    if _SxHTMLParser is not None:
+        return _parse_article_links_sx(html)
+    return _parse_article_links_bs4(html)
+
+
+def _parse_article_links_from_html(html: Union[str, bytes]) -> Tuple[List[str], Optional[str]]:
     """Renvoie (liste_urls_articles, url_next) depuis la page /news."""
-    soup = BeautifulSoup(html, "html.parser")
+    raw = html.encode("utf-8") if isinstance(html, str) else html
+
+    # La regex n'est sûre que scopée au bloc .site-list -> <nav>, comme les
+    # parseurs DOM (pas de liens header/footer/"related"). Sans le marqueur,
+    # impossible de scoper : on laisse directement la main au DOM.
+    start = raw.find(b'class="site-list"')
+    if start == -1:
+        return _parse_article_links_dom(html)
+    end = raw.find(b"<nav", start)
+    region = raw[start: end if end != -1 else len(raw)]
+
+    article_urls: List[str] = []
+    for m in _RE_NEWS_HREF.finditer(region):
+        url = _abs_and_encode(_unescape(m.group(1).decode("utf-8", "replace")))
+        if url:
+            article_urls.append(url)
+
+    if not article_urls:
+        # Balisage inattendu dans le bloc (attributs réordonnés...) : DOM.
+        return _parse_article_links_dom(html)
+
+    next_url = None
+    for nav in _RE_NAV_BLOCK.finditer(raw):
+        for a in _RE_NAV_ANCHOR.finditer(nav.group(0)):
+            href = _unescape(a.group(1).decode("utf-8", "replace"))
+            text = _RE_TAGS.sub(b"", a.group(2)).decode("utf-8", "replace").strip()
+            next_url = _is_next_link(text, href)
+            if next_url:
+                break
+        if next_url:
+            break
+
+    return article_urls, next_url
+
+
+def _is_next_link(text: str, href: str) -> Optional[str]:
+    """Valide un candidat 'page suivante' ; renvoie l'URL absolue ou None."""
+    if "Next" in text or "offset=" in href:
+        maybe = _abs_and_encode(href)
+        if maybe and maybe.startswith(f"{BASE_URL}/news"):
+            return maybe
+    return None
+
+
+def _parse_article_links_sx(html: Union[str, bytes]) -> Tuple[List[str], Optional[str]]:
+    tree = _SxHTMLParser(html)
+
+    article_urls: List[str] = []
+    for a in tree.css(".site-list .article h3 a[href]"):
+        url = _abs_and_encode(a.attributes.get("href"))
+        if url:
+            article_urls.append(url)
+
+    next_url = None
+    for a in tree.css("nav a.button[href]"):
+        text = (a.text() or "").strip()
+        href = a.attributes.get("href") or ""
+        next_url = _is_next_link(text, href)
+        if next_url:
+            break
 
-    anchors = soup.select(".site-list .article h3 a[href]")
+    return article_urls, next_url
+
+
+def _parse_article_links_bs4(html: Union[str, bytes]) -> Tuple[List[str], Optional[str]]:
+    soup = _soup(html, parse_only=_LIST_STRAINER)
+
+    anchors = _LIST_SEL.select(soup)
     article_urls: List[str] = []
     for a in anchors:
         url = _abs_and_encode(a.get("href"))
@@ -99,14 +352,12 @@ def _parse_article_links_from_html(html: str) -> Tuple[List[str], Optional[str]]
             article_urls.append(url)
 
     next_url = None
-    for a in soup.select("nav a.button[href]"):
+    for a in _NAV_SEL.select(soup):
         text = (a.get_text() or "").strip()
         href = a.get("href") or ""
-        if "Next" in text or "offset=" in href:
-            maybe = _abs_and_encode(href)
-            if maybe and maybe.startswith(f"{BASE_URL}/news"):
-                next_url = maybe
-                break
+        next_url = _is_next_link(text, href)
+        if next_url:
+            break
 
     return article_urls, next_url
 
@@ -119,7 +370,7 @@ def extract_all_news_links(
     """
     Scrape la liste News. max_pages=1 => page courante ; None => toutes les pages via 'Next'.
     """
-    session = _make_session()
+    client = _make_client()
     collected: List[str] = []
     seen = set()
 
@@ -128,11 +379,11 @@ def extract_all_news_links(
 
     while True:
         page_count += 1
-        html = _fetch_html(session, current)
+        html = _fetch_html(client, current)
         links, next_url = _parse_article_links_from_html(html)
 
         for url in links:
-            if url.startswith(f"{BASE_URL}/news/") and url.endswith(".html") and url not in seen:
+            if url.startswith(_NEWS_PREFIX) and url.endswith(".html") and url not in seen:
                 seen.add(url)
                 collected.append(url)
 
@@ -145,18 +396,63 @@ def extract_all_news_links(
         else:
             break
 
-    session.close()
+    client.close()
     return collected
 
 
 # --------------------------- parsing d'un article --------------------------- #
-_META_DATE_KEYS = [
-    ("meta", {"property": "article:published_time"}),
-    ("meta", {"name": "article:published_time"}),
-    ("meta", {"name": "pubdate"}),
-    ("meta", {"name": "date"}),
-    ("meta", {"itemprop": "datePublished"}),
-]
+@dataclass(slots=True)
+class Article:
+    """Un article scrappé. slots=True : pas de __dict__ par instance,
+    ni de clés répétées comme avec les anciens dicts (~40% de mémoire en moins)."""
+    url: str
+    title: Optional[str] = None
+    published: Optional[str] = None
+    author: Optional[str] = None
+    location: Optional[str] = None
+    lede: Optional[str] = None
+    text: Optional[str] = None
+    word_count: int = 0
+    image: Optional[str] = None
+    caption: Optional[str] = None
+
+
+# Noms de champs dans l'ordre de déclaration (source de vérité pour l'API).
+ARTICLE_FIELDS: Tuple[str, ...] = tuple(f.name for f in _dc_fields(Article))
+
+
+def _parse_dt(s: str) -> Optional[str]:
+    """
+    Parse une date en ISO. Les métas article:published_time sont quasi
+    toujours ISO 8601 : ciso8601 (C) d'abord, puis fromisoformat,
+    dateutil en repli pour les formats libres. None si rien ne passe.
+    """
+    if ciso8601 is not None:
+        try:
+            return ciso8601.parse_datetime(s.strip()).isoformat()
+        except ValueError:
+            pass
+    s2 = s.strip().replace("Z", "+00:00")
+    try:
+        return datetime.fromisoformat(s2).isoformat()
+    except ValueError:
+        pass
+    try:
+        return dateparser.parse(s).isoformat()
+    except Exception:
+        return None
+
+
+# (attribut, valeur) -> rang de priorité. Un seul parcours des <meta>
+# suffit : on garde le candidat de rang le plus bas.
+_META_DATE_PRIORITY = {
+    ("property", "article:published_time"): 0,
+    ("name", "article:published_time"): 1,
+    ("name", "pubdate"): 2,
+    ("name", "date"): 3,
+    ("itemprop", "datePublished"): 4,
+}
+_META_DATE_ATTRS = ("property", "name", "itemprop")
 
 BODY_SELECTORS = [
     "article .content p",
@@ -167,33 +463,101 @@ BODY_SELECTORS = [
     "div[itemprop='articleBody'] p",
 ]
 
+# Alternatives fusionnées en un seul sélecteur : une passe sur l'arbre au
+# lieu de six (l'union remplace la priorité par l'ordre du document).
+_BODY_COMBINED_CSS = ", ".join(BODY_SELECTORS)
+
 TITLE_SELECTORS = [
     "article h1", "article h2",
     ".article h1", ".article h2",
     "h1", "h2",
 ]
 
+# Sélecteurs soupsieve précompilés (chemin BeautifulSoup) : évite de
+# recompiler la chaîne CSS à chaque select() / select_one().
+_LIST_SEL = sv.compile(".site-list .article h3 a[href]")
+_NAV_SEL = sv.compile("nav a.button[href]")
+_BODY_SEL = sv.compile(_BODY_COMBINED_CSS)
+_BODY_SEL_ALTS = [sv.compile(s) for s in BODY_SELECTORS]
+_TITLE_SEL = [sv.compile(s) for s in TITLE_SELECTORS]
+_VISIBLE_DATE_SEL = sv.compile("article h3, .article h3")
+_IMG_SEL = sv.compile("figure.article-image img")
+_CAP_SEL = sv.compile("figcaption.article-image-caption")
+
 _AUTHOR_RE = re.compile(r"^\s*By\s+([^–—\-]+)\s+[–—\-]\s*", re.IGNORECASE)
 _LOC_RE = re.compile(r"[–—\-]\s*([^()]+?)\s*\(Econostream\)\s*[–—\-]")
 
 
-def _extract_meta_published(soup: BeautifulSoup) -> Optional[str]:
-    for tag, attrs in _META_DATE_KEYS:
-        node = soup.find(tag, attrs=attrs)
-        if node:
-            content = node.get("content") or node.get("value")
+def _best_meta_date(metas) -> Optional[str]:
+    """Choisit le contenu du <meta> de date le mieux classé ; metas est une
+    liste de dicts d'attributs (un par balise)."""
+    best_rank = None
+    best_content = None
+    for attrs in metas:
+        for key in _META_DATE_ATTRS:
+            value = attrs.get(key)
+            if not value:
+                continue
+            rank = _META_DATE_PRIORITY.get((key, value))
+            if rank is None or (best_rank is not None and rank >= best_rank):
+                continue
+            content = attrs.get("content") or attrs.get("value")
             if content:
-                try:
-                    dt = dateparser.parse(content)
-                    return dt.isoformat()
-                except Exception:
-                    return _clean(content)
+                best_rank = rank
+                best_content = content
+                if rank == 0:
+                    return best_content
+    return best_content
+
+
+def _extract_meta_published_sx(tree) -> Optional[str]:
+    content = _best_meta_date([node.attributes for node in tree.css("meta")])
+    if content:
+        return _parse_dt(content) or _clean(content)
+    return None
+
+
+def _extract_visible_date_sx(tree) -> Optional[str]:
+    """Date dans <article><h3>29 August 2025</h3> → ISO si possible."""
+    node = tree.css_first("article h3, .article h3")
+    if node:
+        txt = _clean(node.text())
+        if txt:
+            try:
+                return dateparser.parse(txt).date().isoformat()
+            except Exception:
+                return txt
+    return None
+
+
+def _extract_title_sx(tree) -> Optional[str]:
+    for sel in TITLE_SELECTORS:
+        node = tree.css_first(sel)
+        if node:
+            txt = _clean(node.text())
+            if txt:
+                return txt
+
+    # Fallbacks via métas et <title>
+    meta = tree.css_first('meta[property="og:title"]') or tree.css_first('meta[name="twitter:title"]')
+    if meta and (meta.attributes.get("content") or "").strip():
+        return _clean(meta.attributes["content"])
+    title_node = tree.css_first("title")
+    if title_node and title_node.text():
+        return _clean(title_node.text())
+    return None
+
+
+def _extract_meta_published(soup: BeautifulSoup) -> Optional[str]:
+    content = _best_meta_date([node.attrs for node in soup.find_all("meta")])
+    if content:
+        return _parse_dt(content) or _clean(content)
     return None
 
 
 def _extract_visible_date(soup: BeautifulSoup) -> Optional[str]:
     """Date dans <article><h3>29 August 2025</h3> → ISO si possible."""
-    node = soup.select_one("article h3, .article h3")
+    node = _VISIBLE_DATE_SEL.select_one(soup)
     if node:
         txt = _clean(node.get_text())
         if txt:
@@ -205,10 +569,12 @@ def _extract_visible_date(soup: BeautifulSoup) -> Optional[str]:
 
 
 def _extract_title(soup: BeautifulSoup) -> Optional[str]:
-    for sel in TITLE_SELECTORS:
-        node = soup.select_one(sel)
-        if node and _clean(node.get_text()):
-            return _clean(node.get_text())
+    for sel in _TITLE_SEL:
+        node = sel.select_one(soup)
+        if node:
+            txt = _clean(node.get_text())
+            if txt:
+                return txt
 
     # Fallbacks via métas et <title>
     meta = soup.find("meta", {"property": "og:title"}) or soup.find("meta", {"name": "twitter:title"})
@@ -220,10 +586,10 @@ def _extract_title(soup: BeautifulSoup) -> Optional[str]:
 
 
 def _first_meaningful_paragraph(paragraphs: List[str]) -> Optional[str]:
+    """Premier paragraphe substantiel d'une liste déjà nettoyée."""
     for p in paragraphs:
-        txt = _clean(p)
-        if len(txt) >= 20:
-            return txt
+        if len(p) >= 20:
+            return p
     return paragraphs[0] if paragraphs else None
 
 
@@ -242,28 +608,17 @@ def _extract_author_and_location(text: str) -> Tuple[Optional[str], Optional[str
     return author, location
 
 
-def parse_article_html(html: str, url: str) -> Dict[str, Optional[str]]:
-    """
-    Parse une page article et renvoie un dict:
-      url, title, published, author, location, lede, text, word_count, image, caption
-    """
-    soup = BeautifulSoup(html, "html.parser")
-
-    title = _extract_title(soup)
-    published_iso = _extract_meta_published(soup) or _extract_visible_date(soup)
-
-    # Collecte des paragraphes
-    paragraphs: List[str] = []
-    for sel in BODY_SELECTORS:
-        parts = [p.get_text(separator=" ", strip=True) for p in soup.select(sel)]
-        if parts:
-            paragraphs = parts
-            break
-    if not paragraphs:
-        parts = [p.get_text(separator=" ", strip=True) for p in soup.find_all("p")]
-        paragraphs = parts
-
-    paragraphs = [_clean(p) for p in paragraphs if _clean(p)]
+def _assemble_article(
+    url: str,
+    title: Optional[str],
+    published_iso: Optional[str],
+    paragraphs: List[str],
+    page_text: str,
+    image_url: Optional[str],
+    caption: Optional[str],
+) -> Article:
+    """Partie commune aux deux moteurs : lede, auteur/lieu, fallback date.
+    `paragraphs` doit déjà être nettoyé (_clean) et sans entrées vides."""
     lede = _first_meaningful_paragraph(paragraphs)
     body_text = "\n\n".join(paragraphs) if paragraphs else None
 
@@ -274,8 +629,7 @@ def parse_article_html(html: str, url: str) -> Dict[str, Optional[str]]:
 
     # Fallback date visible par regex générale si rien trouvé
     if not published_iso:
-        vis_date = None
-        m = re.search(r"\b(\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})\b", soup.get_text(" ", strip=True))
+        m = _RE_DATE_FALLBACK.search(page_text)
         if m:
             vis_date = m.group(1)
             try:
@@ -283,65 +637,232 @@ def parse_article_html(html: str, url: str) -> Dict[str, Optional[str]]:
             except Exception:
                 published_iso = vis_date
 
+    word_count = len(body_text.split()) if body_text else 0
+
+    return Article(
+        url=url,
+        title=title,
+        published=published_iso,
+        author=author,
+        location=location,
+        lede=lede,
+        text=body_text,
+        word_count=word_count,
+        image=image_url,
+        caption=caption,
+    )
+
+
+def parse_article_html(html: Union[str, bytes], url: str) -> Article:
+    """
+    Parse une page article et renvoie un Article:
+      url, title, published, author, location, lede, text, word_count, image, caption
+    """
+    if _SxHTMLParser is not None:
+        return _parse_article_sx(html, url)
+    return _parse_article_bs4(html, url)
+
+
+def _parse_article_sx(html: Union[str, bytes], url: str) -> Article:
+    tree = _SxHTMLParser(html)
+
+    title = _extract_title_sx(tree)
+    published_iso = _extract_meta_published_sx(tree) or _extract_visible_date_sx(tree)
+
+    # Collecte des paragraphes : extraction + nettoyage en une seule passe.
+    # NB: pas de sélecteur combiné ici — Modest ne déduplique pas les nœuds
+    # matchant plusieurs alternatives d'une liste CSS, on garde la priorité.
+    paragraphs: List[str] = []
+    for sel in BODY_SELECTORS:
+        for p in tree.css(sel):
+            t = _clean(p.text(separator=" ", strip=True))
+            if t:
+                paragraphs.append(t)
+        if paragraphs:
+            break
+    if not paragraphs:
+        for p in tree.css("p"):
+            t = _clean(p.text(separator=" ", strip=True))
+            if t:
+                paragraphs.append(t)
+
+    page_text = tree.text(separator=" ", strip=True) if not published_iso else ""
+
     # Image + légende (si présentes)
-    img_node = soup.select_one("figure.article-image img")
+    img_node = tree.css_first("figure.article-image img")
+    src = img_node.attributes.get("src") if img_node else None
+    image_url = _abs_and_encode(src) if src else None
+    cap_node = tree.css_first("figcaption.article-image-caption")
+    caption = _clean(cap_node.text()) if cap_node else None
+
+    return _assemble_article(url, title, published_iso, paragraphs, page_text, image_url, caption)
+
+
+def _parse_article_bs4(html: Union[str, bytes], url: str) -> Article:
+    soup = _soup(html, parse_only=_ARTICLE_STRAINER)
+
+    title = _extract_title(soup)
+    published_iso = _extract_meta_published(soup) or _extract_visible_date(soup)
+
+    # Collecte des paragraphes : une seule passe d'arbre (sélecteur combiné),
+    # puis répartition par alternative via sv.match pour conserver la
+    # priorité des BODY_SELECTORS — même sémantique que le moteur selectolax.
+    matches = _BODY_SEL.select(soup)
+    _texts: Dict[int, str] = {}
+
+    def _txt(p) -> str:
+        t = _texts.get(id(p))
+        if t is None:
+            t = _clean(p.get_text(separator=" ", strip=True))
+            _texts[id(p)] = t
+        return t
+
+    paragraphs: List[str] = []
+    for alt in _BODY_SEL_ALTS:
+        bucket = [t for p in matches if alt.match(p) and (t := _txt(p))]
+        if bucket:
+            paragraphs = bucket
+            break
+    if not paragraphs:
+        for p in soup.find_all("p"):
+            t = _clean(p.get_text(separator=" ", strip=True))
+            if t:
+                paragraphs.append(t)
+
+    page_text = soup.get_text(" ", strip=True) if not published_iso else ""
+
+    # Image + légende (si présentes)
+    img_node = _IMG_SEL.select_one(soup)
     image_url = _abs_and_encode(img_node.get("src")) if img_node and img_node.get("src") else None
-    cap_node = soup.select_one("figcaption.article-image-caption")
+    cap_node = _CAP_SEL.select_one(soup)
     caption = _clean(cap_node.get_text()) if cap_node else None
 
-    word_count = len(body_text.split()) if body_text else 0
+    return _assemble_article(url, title, published_iso, paragraphs, page_text, image_url, caption)
+
+
+def _parse_pair(pair: Tuple[str, bytes]) -> Article:
+    """Adaptateur picklable (url, html) -> article pour le pool de process."""
+    url, html = pair
+    return parse_article_html(html, url)
+
+
+# En dessous de ce nombre d'articles, le fork coûte plus cher que le parse.
+_PARSE_POOL_THRESHOLD = 4
+
+
+def _parse_pairs(pairs: List[Tuple[str, bytes]]) -> List[Article]:
+    """Parse un lot (url, html), en parallèle sur les cœurs si le lot est grand."""
+    if len(pairs) >= _PARSE_POOL_THRESHOLD and (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            return list(ex.map(_parse_pair, pairs))
+    return [parse_article_html(html, url) for url, html in pairs]
 
-    return {
-        "url": url,
-        "title": title,
-        "published": published_iso,
-        "author": author,
-        "location": location,
-        "lede": lede,
-        "text": body_text,
-        "word_count": word_count,
-        "image": image_url,
-        "caption": caption,
-    }
-
-
-def fetch_article(url: str, session: Optional[requests.Session] = None) -> Dict[str, Optional[str]]:
+
+def fetch_article(url: str, client: Optional[httpx.Client] = None) -> Article:
     """Télécharge et parse un article unique."""
-    owns = session is None
-    session = session or _make_session()
+    # Cache d'abord : inutile de construire un client HTTP/2 pour un hit.
+    cached = _cache_get(url)
+    if cached is not None:
+        return cached
+    owns = client is None
+    client = client or _make_client()
     try:
-        html = _fetch_html(session, url)
-        return parse_article_html(html, url)
+        html = _fetch_html(client, url)
+        article = parse_article_html(html, url)
+        _cache_put(url, article)
+        return article
     finally:
         if owns:
-            session.close()
+            client.close()
 
 
-def scrape_full(
+async def scrape_full(
     start_url: str = START_URL,
     max_pages: Optional[int] = 1,
     offset: int = 0,
     limit: Optional[int] = None,
     delay_sec: float = 0.4,
-) -> Tuple[List[Dict[str, Optional[str]]], int]:
+) -> Tuple[List[Article], int]:
     """
     Récupère les URLs (max_pages), puis télécharge/parse uniquement
     le slice demandé: [offset : offset+limit]. Renvoie (items, total_urls).
+    Les articles sont téléchargés en concurrence (Semaphore + keep-alive),
+    le rate-limit delay_sec ne s'applique qu'à la pagination de la liste.
+    Le crawl de liste (httpx sync + time.sleep) et le parse (pool de
+    process) sont déportés hors de la boucle asyncio pour ne pas bloquer
+    les autres requêtes (/healthz compris) pendant un gros crawl.
     """
-    session = _make_session()
-    try:
-        urls = extract_all_news_links(start_url=start_url, max_pages=max_pages, delay_sec=delay_sec)
-        total = len(urls)
+    urls = await asyncio.to_thread(
+        extract_all_news_links, start_url=start_url, max_pages=max_pages, delay_sec=delay_sec
+    )
+    total = len(urls)
 
-        if offset < 0:
-            offset = 0
-        sel = urls[offset: offset + limit] if (limit is not None) else urls[offset:]
+    if offset < 0:
+        offset = 0
+    sel = urls[offset: offset + limit] if (limit is not None) else urls[offset:]
 
-        results: List[Dict[str, Optional[str]]] = []
-        for u in sel:
-            html = _fetch_html(session, u)
-            results.append(parse_article_html(html, u))
-            time.sleep(delay_sec)
-        return results, total
-    finally:
-        session.close()
+    # Cache d'abord : on ne télécharge que les URLs jamais vues (ou expirées).
+    hits = {u: art for u in sel if (art := _cache_get(u)) is not None}
+    to_fetch = [u for u in sel if u not in hits]
+
+    pairs = await _fetch_many(to_fetch)
+    for (u, _), article in zip(pairs, await asyncio.to_thread(_parse_pairs, pairs)):
+        _cache_put(u, article)
+        hits[u] = article
+
+    results = [hits[u] for u in sel if u in hits]
+    return results, total
+
+
+async def iter_articles(
+    start_url: str = START_URL,
+    max_pages: Optional[int] = 1,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    delay_sec: float = 0.4,
+) -> AsyncIterator[Article]:
+    """
+    Variante streaming de scrape_full : génère chaque Article dès que son
+    téléchargement se termine (ordre d'arrivée, pas ordre de la liste).
+    Comme scrape_full, le crawl de liste et le parse sortent de la boucle.
+    """
+    urls = await asyncio.to_thread(
+        extract_all_news_links, start_url=start_url, max_pages=max_pages, delay_sec=delay_sec
+    )
+
+    if offset < 0:
+        offset = 0
+    sel = urls[offset: offset + limit] if (limit is not None) else urls[offset:]
+    if not sel:
+        return
+
+    to_fetch = []
+    for u in sel:
+        cached = _cache_get(u)
+        if cached is not None:
+            yield cached
+        else:
+            to_fetch.append(u)
+    if not to_fetch:
+        return
+
+    sem = asyncio.Semaphore(_FETCH_CONCURRENCY)
+    async with _make_async_client() as client:
+        tasks = [asyncio.ensure_future(_afetch_pair(client, u, sem)) for u in to_fetch]
+        try:
+            for fut in asyncio.as_completed(tasks):
+                try:
+                    url, html = await fut
+                except httpx.HTTPError:
+                    # Un article en échec (après retries) ne coupe pas le flux.
+                    continue
+                article = await asyncio.to_thread(parse_article_html, html, url)
+                _cache_put(url, article)
+                yield article
+        finally:
+            # Sortie anticipée (exception, client NDJSON déconnecté) : annule
+            # les fetches en vol et absorbe leurs exceptions, sinon
+            # "Task exception was never retrieved".
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
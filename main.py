@@ -5,22 +5,25 @@ from datetime import date
 from typing import List, Optional, Sequence
 
 from fastapi import FastAPI, Query
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 import io, csv
+import orjson
 
 from econostream_requests import (
+    Article,
+    ARTICLE_FIELDS,
     extract_all_news_links,
+    iter_articles,
     scrape_full as scrape_full_impl,
     START_URL,
 )
 
-app = FastAPI(title="Econostream Scraper API", version="1.3.0")
+# orjson (C, SIMD) sérialise bien plus vite que le json stdlib.
+app = FastAPI(title="Econostream Scraper API", version="1.3.0",
+              default_response_class=ORJSONResponse)
 
 # --- utils API --- #
-ALL_FIELDS: Sequence[str] = (
-    "url", "title", "published", "author", "location",
-    "lede", "text", "word_count", "image", "caption"
-)
+ALL_FIELDS: Sequence[str] = ARTICLE_FIELDS
 
 def _parse_fields(fields: Optional[str]) -> List[str]:
     if not fields:
@@ -30,8 +33,8 @@ def _parse_fields(fields: Optional[str]) -> List[str]:
     keep = [f for f in want if f in ALL_FIELDS]
     return keep if keep else list(ALL_FIELDS)
 
-def _project_item(item: dict, keep: Sequence[str]) -> dict:
-    return {k: item.get(k) for k in keep}
+def _project_item(item: Article, keep: Sequence[str]) -> dict:
+    return {k: getattr(item, k) for k in keep}
 
 # --- endpoints --- #
 @app.get("/healthz")
@@ -55,7 +58,7 @@ def scrape(
         links = extract_all_news_links(start_url=START_URL, max_pages=effective_max, delay_sec=delay_sec)
         total = len(links)
         sel = links[offset: offset + limit] if (limit is not None) else links[offset:]
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "status": "ok",
             "total": total,
             "offset": offset,
@@ -63,11 +66,11 @@ def scrape(
             "links": sel
         })
     except Exception as e:
-        return JSONResponse(status_code=500, content={"status": "error", "message": str(e)})
+        return ORJSONResponse(status_code=500, content={"status": "error", "message": str(e)})
 
 
 @app.get("/scrape_full")
-def scrape_full_endpoint(
+async def scrape_full_endpoint(
     max_pages: Optional[int] = Query(1, ge=1, description="Nombre de pages /news à collecter (None = toutes)"),
     all_pages: bool = Query(False, description="Si true, ignore max_pages"),
     offset: int = Query(0, ge=0, description="Décalage dans la liste d'articles"),
@@ -90,7 +93,7 @@ def scrape_full_endpoint(
             limit = ps
 
         effective_max = None if all_pages else max_pages
-        items, total = scrape_full_impl(
+        items, total = await scrape_full_impl(
             start_url=START_URL,
             max_pages=effective_max,
             offset=offset,
@@ -101,7 +104,7 @@ def scrape_full_endpoint(
         keep = _parse_fields(fields)
         items = [_project_item(it, keep) for it in items]
 
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "status": "ok",
             "total": total,        # nb total de candidats trouvés sur /news (selon max_pages)
             "offset": offset,
@@ -110,11 +113,48 @@ def scrape_full_endpoint(
             "items": items,
         })
     except Exception as e:
-        return JSONResponse(status_code=500, content={"status": "error", "message": str(e)})
+        return ORJSONResponse(status_code=500, content={"status": "error", "message": str(e)})
+
+
+@app.get("/scrape_full.ndjson")
+async def scrape_full_ndjson(
+    max_pages: Optional[int] = Query(1, ge=1),
+    all_pages: bool = Query(False),
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(10, ge=1),
+    delay_sec: float = Query(0.4, ge=0.0, le=5.0),
+    fields: Optional[str] = Query(None, description="Champs à renvoyer, ex: url,title,published"),
+    page: Optional[int] = Query(None, ge=1),
+    page_size: Optional[int] = Query(None, ge=1),
+):
+    """
+    Même données que /scrape_full, mais en NDJSON streamé : chaque article
+    est émis dès la fin de son téléchargement (mémoire constante, premier
+    octet immédiat). L'ordre est celui d'arrivée.
+    """
+    if page is not None:
+        ps = page_size or (limit or 10)
+        offset = (page - 1) * ps
+        limit = ps
+
+    effective_max = None if all_pages else max_pages
+    keep = _parse_fields(fields)
+
+    async def gen():
+        async for art in iter_articles(
+            start_url=START_URL,
+            max_pages=effective_max,
+            offset=offset,
+            limit=limit,
+            delay_sec=delay_sec,
+        ):
+            yield orjson.dumps(_project_item(art, keep)) + b"\n"
+
+    return StreamingResponse(gen(), media_type="application/x-ndjson")
 
 
 @app.get("/scrape_full.csv")
-def scrape_full_csv(
+async def scrape_full_csv(
     max_pages: Optional[int] = Query(1, ge=1),
     all_pages: bool = Query(False),
     offset: int = Query(0, ge=0),
@@ -134,7 +174,7 @@ def scrape_full_csv(
             limit = ps
 
         effective_max = None if all_pages else max_pages
-        items, total = scrape_full_impl(
+        items, total = await scrape_full_impl(
             start_url=START_URL,
             max_pages=effective_max,
             offset=offset,
@@ -148,11 +188,11 @@ def scrape_full_csv(
         writer = csv.DictWriter(buf, fieldnames=keep, extrasaction="ignore")
         writer.writeheader()
         for it in items:
-            writer.writerow({k: it.get(k, "") for k in keep})
+            writer.writerow({k: getattr(it, k, "") for k in keep})
         buf.seek(0)
 
         filename = f"econostream_{date.today().isoformat()}.csv"
         headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
         return StreamingResponse(iter([buf.getvalue()]), media_type="text/csv", headers=headers)
     except Exception as e:
-        return JSONResponse(status_code=500, content={"status": "error", "message": str(e)})
+        return ORJSONResponse(status_code=500, content={"status": "error", "message": str(e)})
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du parsing d'articles (cf. CONTRIBUTING §4) : les deux moteurs
+(selectolax et BeautifulSoup) doivent produire des Article identiques.
+"""
+import pytest
+
+from econostream_requests import (
+    Article,
+    _parse_article_bs4,
+    _parse_article_sx,
+    parse_article_html,
+)
+
+URL = "https://www.econostream-media.com/news/test-article.html"
+
+# Page article typique : méta ISO, titre, lede "By ... – VILLE (Econostream) –",
+# image + légende.
+ARTICLE_HTML = """<html><head>
+<title>Titre de repli - Econostream</title>
+<meta property="article:published_time" content="2025-08-29T10:00:00Z">
+<meta property="og:title" content="Titre OG">
+</head><body>
+<header><p>menu</p></header>
+<article>
+<h1>ECB Says Things About Policy</h1>
+<h3>29 August 2025</h3>
+<div class="content">
+<p>By Jane Doe – FRANKFURT (Econostream) – The European Central Bank said things today about monetary policy.</p>
+<p>Second paragraph with a few more words.</p>
+</div>
+<figure class="article-image"><img src="/img/a’b.jpg"></figure>
+<figcaption class="article-image-caption">Une légende</figcaption>
+</article>
+</body></html>"""
+
+# Cas de divergence chunk0-23 : un <p> parasite dans <article> mais hors
+# .content ne doit pas entrer dans le corps, quel que soit le moteur.
+STRAY_P_HTML = """<article><h1>T</h1>
+<div class="content"><p>By Jane Doe – FRANKFURT (Econostream) – The ECB said things today about policy.</p>
+<p>Second paragraph with words.</p></div>
+<p>Stray share/footer paragraph that should not be in the body.</p>
+</article>"""
+
+
+@pytest.mark.parametrize("html", [ARTICLE_HTML, STRAY_P_HTML], ids=["typique", "p-parasite"])
+def test_both_engines_identical(html):
+    assert _parse_article_sx(html, URL) == _parse_article_bs4(html, URL)
+
+
+def test_article_fields():
+    art = parse_article_html(ARTICLE_HTML, URL)
+    assert isinstance(art, Article)
+    assert art.title == "ECB Says Things About Policy"
+    assert art.published == "2025-08-29T10:00:00+00:00"
+    assert art.author == "Jane Doe"
+    assert art.location == "FRANKFURT"
+    assert art.lede.startswith("By Jane Doe")
+    assert art.word_count == len(art.text.split())
+    assert art.image == "https://www.econostream-media.com/img/a%E2%80%99b.jpg"
+    assert art.caption == "Une légende"
+
+
+def test_stray_paragraph_excluded():
+    art = parse_article_html(STRAY_P_HTML, URL)
+    assert "Stray" not in art.text
+    assert art.text.count("\n\n") == 1  # deux paragraphes de .content
+
+
+def test_accepts_bytes():
+    assert parse_article_html(ARTICLE_HTML.encode("utf-8"), URL) == parse_article_html(ARTICLE_HTML, URL)